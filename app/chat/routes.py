@@ -14,8 +14,12 @@ knowledge base; it currently returns nothing.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
 from typing import Any, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -41,12 +45,28 @@ MODEL = "claude-haiku-4-5-20251001"
 MAX_TOKENS = 1024
 TEMPERATURE = 0.3
 MAX_TURNS = 16  # keep the last N messages so the prompt stays bounded
+SYSTEM_CACHE_SIZE = 64  # distinct assessments whose system blocks stay memoized
+
+# The SDK retries 408/409/429/5xx and connection errors with exponential backoff
+# (honouring Retry-After) before a stream opens; make the budget explicit.
+MAX_RETRIES = 4
+# After this many consecutive provider failures, fail fast for a cooldown instead of
+# making every farmer wait out the full retry budget during an outage.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN_S = 30.0
 
 # One async client for the process; None if no key, so the endpoint can 503 cleanly.
 _API_KEY = os.getenv("ANTHROPIC_API_KEY")
 _client: Optional[anthropic.AsyncAnthropic] = (
-    anthropic.AsyncAnthropic(api_key=_API_KEY) if _API_KEY else None
+    anthropic.AsyncAnthropic(api_key=_API_KEY, max_retries=MAX_RETRIES) if _API_KEY else None
 )
+_consecutive_failures = 0
+_breaker_open_until = 0.0
+
+# Process-wide cap on open model streams. Every user shares one org rate limit, so a
+# burst of chats waits here for a slot instead of fanning out into 429s and retries.
+MAX_CONCURRENT_STREAMS = int(os.getenv("ANTHROPIC_MAX_CONCURRENCY", "20"))
+_stream_slots = asyncio.Semaphore(MAX_CONCURRENT_STREAMS)
 
 SYSTEM_INSTRUCTIONS = (
     "You are a friendly guide that explains a farm's life cycle assessment (LCA) "
@@ -67,6 +87,8 @@ SYSTEM_INSTRUCTIONS = (
     "pending independent review, so gently note the uncertainty if a number is treated as exact.\n"
     + GROUNDING_RULES
 )
+# The static first system block, built once so every request sends the same object.
+_INSTRUCTIONS_BLOCK = {"type": "text", "text": SYSTEM_INSTRUCTIONS}
 
 
 class ChatMessage(BaseModel):
@@ -80,7 +102,7 @@ class ChatRequest(BaseModel):
     assessment_data: Optional[dict] = None
 
 
-def retrieve_context(assessment: dict) -> List[str]:
+def retrieve_context(assessment: dict) -> Optional[List[str]]:
     """Grounded guidance for the farmer-guide layer.
 
     Returns short, cited practice snippets drawn from the deterministic recommendation
@@ -88,12 +110,14 @@ def retrieve_context(assessment: dict) -> List[str]:
     there is nothing for the model to invent. Assessment-driven (not query-driven) so the
     grounding block stays byte-stable across a conversation and keeps the prompt cache.
     Never raises: guidance is additive, and chat must work even if it's unavailable.
+    Returns None (not []) when guidance could not be produced, so the failure is not
+    memoized as "this farm has no guidance".
     """
     try:
         from recommendations.service import guidance_for_chat
         return guidance_for_chat(assessment)
     except Exception:
-        return []
+        return None
 
 
 def _resolve_assessment(req: ChatRequest, user: User, db: Session) -> dict:
@@ -111,7 +135,7 @@ def _resolve_assessment(req: ChatRequest, user: User, db: Session) -> dict:
     )
 
 
-def _build_system(grounding: str, assessment: dict) -> list[dict]:
+def _build_system(grounding: str, extra: Optional[List[str]]) -> list[dict]:
     """System prompt as two blocks: static instructions, then this farm's grounding
     (plus any retrieved guidance). The grounding block is marked cacheable so repeated
     turns in the same conversation do not re-pay for it.
@@ -119,21 +143,79 @@ def _build_system(grounding: str, assessment: dict) -> list[dict]:
     The guidance is labelled distinctly from the farm's own measured results, and each
     line carries a source, so the model can tell 'this farm measured X' from 'general
     practice guidance says Y' — a grounding requirement, not decoration."""
-    context = "GROUNDING (this farm's computed results, JSON):\n" + grounding
-    extra = retrieve_context(assessment)
+    parts = ["GROUNDING (this farm's computed results, JSON):\n", grounding]
     if extra:
-        context += (
+        parts.append(
             "\n\nPRACTICAL GUIDANCE (general good-practice measures matched to this "
             "farm's biggest impact sources; each is a suggestion with a source, NOT a "
             "measured result for this farm — present them as options and cite the source "
-            "if asked):\n" + "\n".join(f"- {s}" for s in extra)
+            "if asked):\n"
         )
+        parts.append("\n".join(f"- {s}" for s in extra))
     return [
-        {"type": "text", "text": SYSTEM_INSTRUCTIONS},
-        {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+        _INSTRUCTIONS_BLOCK,
+        {"type": "text", "text": "".join(parts), "cache_control": {"type": "ephemeral"}},
     ]
 
 
+# Every turn of a conversation resends the same assessment, and building its system
+# blocks (grounding + a full recommender run for guidance) is deterministic. Memoize
+# them by content so follow-up turns skip that work and reuse a byte-identical prefix.
+_system_cache: "OrderedDict[str, list[dict]]" = OrderedDict()
+
+
+def _assessment_key(assessment: dict) -> str:
+    blob = json.dumps(assessment, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+def _system_for(assessment: dict) -> list[dict]:
+    """Memoized `_build_system` for one assessment. Raises MissingIsoReportError
+    (never cached) when the assessment has no deterministic iso_report. If guidance
+    was unavailable the blocks are returned but not cached, so the next turn retries."""
+    key = _assessment_key(assessment)
+    system = _system_cache.get(key)
+    if system is not None:
+        _system_cache.move_to_end(key)
+        return system
+    grounding = format_grounding_for_prompt(assessment)
+    extra = retrieve_context(assessment)
+    system = _build_system(grounding, extra)
+    if extra is None:
+        return system
+    _system_cache[key] = system
+    if len(_system_cache) > SYSTEM_CACHE_SIZE:
+        _system_cache.popitem(last=False)
+    return system
+
+
+def _breaker_is_open() -> bool:
+    return time.monotonic() < _breaker_open_until
+
+
+def _is_provider_failure(e: Exception) -> bool:
+    """Outage-shaped errors only; a 4xx caused by our own request must not trip the
+    breaker. An error event that arrives after the stream opened (e.g. overloaded_error)
+    is raised as a bare APIStatusError carrying the 200 response, so it counts too."""
+    if isinstance(e, anthropic.APIConnectionError):
+        return True
+    if isinstance(e, anthropic.APIStatusError):
+        return e.status_code == 429 or not 400 <= e.status_code < 500
+    return False
+
+
+def _record_provider_result(ok: bool) -> None:
+    """Track consecutive provider failures; trip the breaker at BREAKER_THRESHOLD."""
+    global _consecutive_failures, _breaker_open_until
+    if ok:
+        _consecutive_failures = 0
+        return
+    _consecutive_failures += 1
+    if _consecutive_failures >= BREAKER_THRESHOLD:
+        _breaker_open_until = time.monotonic() + BREAKER_COOLDOWN_S
+        _consecutive_failures = 0
+
+
 @router.post("/stream")
 async def chat_stream(
     req: ChatRequest,
@@ -150,21 +232,25 @@ async def chat_stream(
             status_code=503,
             detail="Chat is unavailable: ANTHROPIC_API_KEY is not configured on the server.",
         )
+    if _breaker_is_open():
+        raise HTTPException(
+            status_code=503,
+            detail="Chat is temporarily unavailable: the AI provider is failing. Try again shortly.",
+        )
     if not req.messages or req.messages[-1].role != "user":
         raise HTTPException(status_code=400, detail="messages must end with a user turn.")
 
     assessment = _resolve_assessment(req, user, db)
     try:
-        grounding = format_grounding_for_prompt(assessment)
+        system = _system_for(assessment)
     except MissingIsoReportError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    system = _build_system(grounding, assessment)
     messages = [{"role": m.role, "content": m.content} for m in req.messages][-MAX_TURNS:]
 
     async def event_stream():
         try:
-            async with _client.messages.stream(
+            async with _stream_slots, _client.messages.stream(
                 model=MODEL,
                 max_tokens=MAX_TOKENS,
                 temperature=TEMPERATURE,
@@ -173,8 +259,11 @@ async def chat_stream(
             ) as stream:
                 async for text in stream.text_stream:
                     yield f"data: {json.dumps({'delta': text})}\n\n"
+            _record_provider_result(True)
             yield "event: done\ndata: {}\n\n"
         except Exception as e:  # surface a clean error to the client, do not crash the app
+            if _is_provider_failure(e):
+                _record_provider_result(False)
             yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
 
     return StreamingResponse(
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.utils import generate_unique_id as _default_unique_id
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -91,6 +92,11 @@ app.add_middleware(
 # headers are present on the 500 responses this produces (see the class docstring).
 app.add_middleware(CatchUnhandledErrorsMiddleware)
 
+# Compress sizeable responses (assessment results with their ISO report, schema) for
+# clients that send Accept-Encoding: gzip. Starlette leaves text/event-stream alone,
+# so the chat stream still flushes token by token.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # Add CORS middleware - restrict to known origins. Added LAST so it is the OUTERMOST
 # middleware, wrapping the catch-all above and thus every error response.
 ALLOWED_ORIGINS = [
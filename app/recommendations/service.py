@@ -137,11 +137,11 @@ def build_recommendations(payload: dict, request_json: Optional[dict], *,
     )
 
 
-def guidance_for_chat(payload: dict, *, limit: int = 4) -> list[str]:
+def guidance_for_chat(payload: dict, *, limit: int = 4) -> Optional[list[str]]:
     """Short, cited guidance lines for the chat RAG seam. Assessment-driven (not
     query-driven), so it's stable across a conversation's turns and doesn't break the
-    prompt cache. Returns [] on any failure - chat must never break because the
-    recommender did."""
+    prompt cache. Returns None on any failure - chat must never break because the
+    recommender did, but the caller can tell a failure from "no guidance" ([])."""
     try:
         is_proc = "breakdown_by_product" in payload
         rec = recommend(payload, pricebook=_pricebook(), reviewed_only=_REVIEWED_ONLY,
@@ -149,4 +149,4 @@ def guidance_for_chat(payload: dict, *, limit: int = 4) -> list[str]:
                         context=(_processing_context({}) if is_proc else None))
         return guidance_snippets(rec, limit=limit)
     except Exception:
-        return []
+        return None
@@ -145,6 +145,9 @@ def build_grounding_payload(assessment_data: dict) -> dict:
 
 
 def format_grounding_for_prompt(assessment_data: dict) -> str:
-    """Serialize grounding payload as JSON for LLM prompts."""
+    """Serialize grounding payload as JSON for LLM prompts.
+
+    Compact separators and raw UTF-8: indentation and \\u escapes are pure token
+    overhead the model is billed for on every turn, and add nothing it can read."""
     payload = build_grounding_payload(assessment_data)
-    return json.dumps(payload, indent=2, default=str)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
@@ -0,0 +1,173 @@
+"""Tests for chat system-prompt memoization and the provider breaker (no model calls)."""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from auth.deps import get_current_user
+from chat import routes
+from db import get_db
+from services.report_grounding import MissingIsoReportError
+
+_ASSESSMENT = {
+    "company_name": "Test Farm",
+    "country": "Ghana",
+    "single_score": {"value": 12.5, "unit": "µPt per kg", "band": "typical"},
+    "midpoint_impacts": {"Global warming": {"value": 0.42, "unit": "kg CO2-eq"}},
+    "iso_report": {"scope": {"functional_unit": "1 kg maize"}},
+}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    routes._system_cache.clear()
+    yield
+    routes._system_cache.clear()
+
+
+@pytest.fixture
+def retrieve_calls(monkeypatch):
+    """Stub the recommender seam; the returned list records each call."""
+    calls = []
+
+    def fake_retrieve(assessment):
+        calls.append(assessment)
+        return ["Mulch the field (source: guide)"]
+
+    monkeypatch.setattr(routes, "retrieve_context", fake_retrieve)
+    return calls
+
+
+def test_system_blocks_memoized_by_content(retrieve_calls):
+    first = routes._system_for(_ASSESSMENT)
+    # a fresh but equal dict (the client resends it every turn) hits the memo
+    again = routes._system_for({**_ASSESSMENT})
+    assert again is first
+    assert len(retrieve_calls) == 1
+    assert "1 kg maize" in first[1]["text"]
+    assert "Mulch the field" in first[1]["text"]
+
+
+def test_changed_assessment_rebuilds(retrieve_calls):
+    routes._system_for(_ASSESSMENT)
+    changed = {**_ASSESSMENT, "country": "Nigeria"}
+    assert "Nigeria" in routes._system_for(changed)[1]["text"]
+    assert len(retrieve_calls) == 2
+    assert len(routes._system_cache) == 2
+
+
+def test_guidance_failure_not_cached(monkeypatch):
+    # None means the recommender failed; the next turn must retry rather than
+    # reuse a guidance-less prompt.
+    monkeypatch.setattr(routes, "retrieve_context", lambda assessment: None)
+    system = routes._system_for(_ASSESSMENT)
+    assert "PRACTICAL GUIDANCE" not in system[1]["text"]
+    assert not routes._system_cache
+
+
+def test_no_guidance_is_cached(monkeypatch):
+    monkeypatch.setattr(routes, "retrieve_context", lambda assessment: [])
+    routes._system_for(_ASSESSMENT)
+    assert len(routes._system_cache) == 1
+
+
+def test_cache_is_bounded(monkeypatch, retrieve_calls):
+    monkeypatch.setattr(routes, "SYSTEM_CACHE_SIZE", 2)
+    for i in range(3):
+        routes._system_for({**_ASSESSMENT, "company_name": f"Farm {i}"})
+    assert len(routes._system_cache) == 2
+
+
+def test_missing_iso_report_not_cached(retrieve_calls):
+    with pytest.raises(MissingIsoReportError):
+        routes._system_for({"company_name": "No ISO"})
+    assert not routes._system_cache
+    assert not retrieve_calls  # grounding is checked before the recommender runs
+
+
+def test_breaker_trips_after_consecutive_failures(monkeypatch):
+    monkeypatch.setattr(routes, "_consecutive_failures", 0)
+    monkeypatch.setattr(routes, "_breaker_open_until", 0.0)
+    for _ in range(routes.BREAKER_THRESHOLD - 1):
+        routes._record_provider_result(False)
+    assert not routes._breaker_is_open()
+    routes._record_provider_result(True)  # a success resets the streak
+    for _ in range(routes.BREAKER_THRESHOLD - 1):
+        routes._record_provider_result(False)
+    assert not routes._breaker_is_open()
+    routes._record_provider_result(False)
+    assert routes._breaker_is_open()
+
+
+def _status_error(cls, status):
+    response = httpx.Response(status, request=httpx.Request("POST", "https://api.anthropic.com"))
+    return cls("error", response=response, body=None)
+
+
+def test_mid_stream_error_event_counts_as_provider_failure():
+    # An overloaded_error event after the stream opened: bare APIStatusError on a 200.
+    assert routes._is_provider_failure(_status_error(anthropic.APIStatusError, 200))
+    assert routes._is_provider_failure(_status_error(anthropic.InternalServerError, 529))
+    assert routes._is_provider_failure(_status_error(anthropic.RateLimitError, 429))
+    assert not routes._is_provider_failure(_status_error(anthropic.BadRequestError, 400))
+    assert not routes._is_provider_failure(ValueError("ours"))
+
+
+def test_stream_returns_503_while_breaker_open(monkeypatch):
+    monkeypatch.setattr(routes, "_client", object())  # configured; never called
+    monkeypatch.setattr(routes, "_breaker_open_until", time.monotonic() + 60)
+    main.app.dependency_overrides[get_current_user] = lambda: None
+    main.app.dependency_overrides[get_db] = lambda: None
+    try:
+        resp = TestClient(main.app, base_url="http://localhost").post(
+            "/chat/stream",
+            json={"messages": [{"role": "user", "content": "Hi"}], "assessment_data": _ASSESSMENT},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+    assert resp.status_code == 503
+    assert "temporarily unavailable" in resp.json()["detail"]
+
+
+class _OverloadedMidStream:
+    """Stand-in for client.messages.stream: one token, then an overloaded_error event."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        yield "Hello"
+        raise _status_error(anthropic.APIStatusError, 200)
+
+
+def test_mid_stream_error_trips_breaker_count(monkeypatch, retrieve_calls):
+    fake = SimpleNamespace(messages=SimpleNamespace(stream=_OverloadedMidStream))
+    monkeypatch.setattr(routes, "_client", fake)
+    monkeypatch.setattr(routes, "_consecutive_failures", 0)
+    monkeypatch.setattr(routes, "_breaker_open_until", 0.0)
+    main.app.dependency_overrides[get_current_user] = lambda: None
+    main.app.dependency_overrides[get_db] = lambda: None
+    try:
+        resp = TestClient(main.app, base_url="http://localhost").post(
+            "/chat/stream",
+            json={"messages": [{"role": "user", "content": "Hi"}], "assessment_data": _ASSESSMENT},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+    assert resp.status_code == 200
+    assert '"delta": "Hello"' in resp.text
+    assert "event: error" in resp.text
+    assert routes._consecutive_failures == 1
@@ -1,58 +1,45 @@
 """
 Quick test to verify all imports work correctly
 """
-import sys
+import importlib
+import logging
 import os
+import sys
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
-    os.system('chcp 65001 >nul 2>&1')
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# Per-module status lines go through logging so LOG_LEVEL=WARNING keeps only failures
+log = logging.getLogger("test_imports")
+log.addHandler(logging.StreamHandler(sys.stdout))
+_level = os.getenv("LOG_LEVEL", "INFO").upper()
+# getLevelName maps a known level name to its number; anything else falls back to INFO
+log.setLevel(_level if isinstance(logging.getLevelName(_level), int) else logging.INFO)
+log.propagate = False
+
+# (label, module, attribute that must exist or None)
+IMPORTS = [
+    ("FastAPI", "fastapi", "FastAPI"),
+    ("Anthropic", "anthropic", None),
+    ("Production routes", "production.routes", "router"),
+    ("Processing routes", "processing.routes", "router"),
+    ("Results grounding", "services.report_grounding", "format_grounding_for_prompt"),
+    ("Chat routes", "chat.routes", "router"),
+]
 
 print("Python version:", sys.version)
 print("Python path:", sys.executable)
-print()
-
-try:
-    print("Testing FastAPI import...")
-    from fastapi import FastAPI
-    print("[OK] FastAPI imported successfully")
-except Exception as e:
-    print(f"[FAIL] FastAPI import failed: {e}")
-
-try:
-    print("\nTesting Anthropic import...")
-    import anthropic
-    print("[OK] Anthropic imported successfully")
-except Exception as e:
-    print(f"[FAIL] Anthropic import failed: {e}")
-
-try:
-    print("\nTesting production routes import...")
-    from production.routes import router as production_router
-    print("[OK] Production routes imported successfully")
-except Exception as e:
-    print(f"[FAIL] Production routes import failed: {e}")
-
-try:
-    print("\nTesting processing routes import...")
-    from processing.routes import router as processing_router
-    print("[OK] Processing routes imported successfully")
-except Exception as e:
-    print(f"[FAIL] Processing routes import failed: {e}")
-
-try:
-    print("\nTesting results grounding import...")
-    from services.report_grounding import format_grounding_for_prompt
-    print("[OK] Results grounding module imported successfully")
-except Exception as e:
-    print(f"[FAIL] Results grounding import failed: {e}")
 
-try:
-    print("\nTesting chat routes import...")
-    from chat.routes import router as chat_router
-    print("[OK] Chat routes imported successfully")
-except Exception as e:
-    print(f"[FAIL] Chat routes import failed: {e}")
+for label, module, attr in IMPORTS:
+    log.info("\nTesting %s import...", label)
+    try:
+        imported = importlib.import_module(module)
+        if attr is not None:
+            getattr(imported, attr)
+        log.info("[OK] %s imported successfully", label)
+    except Exception as e:
+        log.error("[FAIL] %s import failed: %s", label, e)
 
 print("\n" + "="*60)
 print("Import test complete!")
@@ -5,17 +5,48 @@ Validates that the processing endpoints work correctly with the Rust backend
 """
 
 import requests
-import json
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API base URL
 BASE_URL = "http://localhost:8000"
+# (connect, read) seconds; an assessment solve can take a while, a connect should not
+TIMEOUT = (3.05, 30)
+
+# One keep-alive session for the whole run, so each call reuses a pooled connection
+# instead of opening a new TCP socket. Transient 429/502/503/504s are retried with
+# exponential backoff (honouring Retry-After) rather than failing the run.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=_RETRY)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+EXAMPLES_DIR = Path(__file__).parent / "processing"
+
+@lru_cache(maxsize=None)
+def _example_body(filename: str) -> bytes:
+    """Raw JSON bytes of an example request, read from disk once per run and POSTed
+    as-is (no parse + re-encode round trip)."""
+    return (EXAMPLES_DIR / filename).read_bytes()
 
 def test_processing_facility_types():
     """Test facility types endpoint"""
     print("Testing /processing/facility-types...")
-    response = requests.get(f"{BASE_URL}/processing/facility-types")
+    response = SESSION.get(f"{BASE_URL}/processing/facility-types", timeout=TIMEOUT)
     
     if response.status_code == 200:
         data = response.json()
@@ -31,18 +62,16 @@ def test_processing_assessment():
     print("\nTesting /processing/assess...")
     
     # Load example assessment
-    example_file = Path(__file__).parent / "processing" / "example_assessment.json"
+    example_file = EXAMPLES_DIR / "example_assessment.json"
     if not example_file.exists():
         print(f"✗ Example file not found: {example_file}")
         return False
     
-    with open(example_file, 'r') as f:
-        assessment_data = json.load(f)
-    
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/processing/assess",
-        json=assessment_data,
-        headers={"Content-Type": "application/json"}
+        data=_example_body(example_file.name),
+        headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
     
     if response.status_code == 200:
@@ -84,18 +113,16 @@ def test_cassava_processing():
     print("\nTesting cassava processing assessment...")
     
     # Load cassava example
-    example_file = Path(__file__).parent / "processing" / "example_cassava_processing.json"
+    example_file = EXAMPLES_DIR / "example_cassava_processing.json"
     if not example_file.exists():
         print(f"✗ Cassava example file not found: {example_file}")
         return False
     
-    with open(example_file, 'r') as f:
-        assessment_data = json.load(f)
-    
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/processing/assess",
-        json=assessment_data,
-        headers={"Content-Type": "application/json"}
+        data=_example_body(example_file.name),
+        headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
     
     if response.status_code == 200:
@@ -128,9 +155,14 @@ def test_benchmarks():
     
     facility_types = ["Mill", "RiceProcessing", "PalmOilMill"]
     
-    for facility_type in facility_types:
-        response = requests.get(f"{BASE_URL}/processing/benchmarks/{facility_type}")
-        
+    # Independent GETs: fetch them concurrently, then report in a stable order
+    with ThreadPoolExecutor(max_workers=len(facility_types)) as pool:
+        responses = list(pool.map(
+            lambda ft: SESSION.get(f"{BASE_URL}/processing/benchmarks/{ft}", timeout=TIMEOUT),
+            facility_types,
+        ))
+    
+    for facility_type, response in zip(facility_types, responses):
         if response.status_code == 200:
             data = response.json()
             print(f"✓ {facility_type} benchmarks available")
@@ -147,7 +179,7 @@ def test_api_health():
     print("Testing API health...")
     
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health", timeout=TIMEOUT)
         if response.status_code == 200:
             print("✓ API is healthy")
             return True
@@ -158,6 +190,38 @@ def test_api_health():
         print("✗ Cannot connect to API. Is it running on localhost:8000?")
         return False
 
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that sends each worker thread's prints to its own buffer,
+    so tests running concurrently do not interleave their output."""
+
+    def __init__(self, real):
+        self.real = real
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buf = io.StringIO()
+
+    def release(self) -> str:
+        buf, self._local.buf = self._local.buf, None
+        return buf.getvalue()
+
+    def write(self, text):
+        buf = getattr(self._local, "buf", None)
+        return (buf or self.real).write(text)
+
+    def flush(self):
+        self.real.flush()
+
+def _run_buffered(test, out):
+    """Run one test with its output captured; returns (passed, output)."""
+    out.capture()
+    try:
+        ok = bool(test())
+    except Exception as e:
+        print(f"✗ Test failed with exception: {e}")
+        ok = False
+    return ok, out.release()
+
 def main():
     """Run all tests"""
     print("=== Processing Facility LCA API Test Suite ===\n")
@@ -176,15 +240,22 @@ def main():
         test_benchmarks,
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"✗ Test failed with exception: {e}")
+    # The tests are independent requests, so run them side by side. Each one's
+    # output is buffered and replayed in list order so the log stays readable.
+    out = _ThreadBufferedStdout(sys.stdout)
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=total) as pool:
+            results = list(pool.map(lambda test: _run_buffered(test, out), tests))
+    finally:
+        sys.stdout = out.real
+    
+    passed = 0
+    for ok, output in results:
+        sys.stdout.write(output)
+        passed += ok
     
     print(f"\n=== Test Results ===")
     print(f"Passed: {passed}/{total}")
@@ -75,3 +75,10 @@ def test_operation_ids_are_unique(client):
 def test_root_advertises_v1(client):
     body = client.get("/").json()
     assert "v1" in body.get("api_versions", {})
+
+
+def test_large_responses_gzip_compressed(client):
+    resp = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers.get("content-encoding") == "gzip"
+    assert "/v1/auth/login" in resp.json()["paths"]  # client transparently decodes